@@ -9,9 +9,203 @@ Created on Fri Jul 02 10:25:17 2021.
 # import builtin modules
 
 # import external public "common" modules
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
+from scipy.linalg import cho_solve_banded, cholesky_banded, solve_banded
+
+# numba is optional: when available the time-stepping loops run as
+# compiled kernels, otherwise the NumPy implementations are used.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_HAS_NUMBA = njit is not None
+
+
+def _maybe_njit(func):
+    r"""
+    Applies numba.njit(cache=True, fastmath=True) to `func` when numba is
+    available, and returns `func` unchanged otherwise.
+    """
+    if njit is None:
+        return func
+    return njit(cache=True, fastmath=True)(func)
 
 
+def _roll_p1(a, out):
+    r"""
+    Fills `out` with `a` shifted one cell to the right, i.e. the same result
+    as np.roll(a, 1) but without allocating a temporary array.
+
+    Parameters
+    ----------
+    a : `array`
+        Array to shift.
+    out : `array`
+        Preallocated array of the same shape as `a`.
+
+    Returns
+    -------
+    `array`
+        The `out` array, with out[j] = a[j-1] (periodic wrap).
+    """
+    out[..., 0] = a[..., -1]
+    out[..., 1:] = a[..., :-1]
+    return out
+
+def _roll_m1(a, out):
+    r"""
+    Fills `out` with `a` shifted one cell to the left, i.e. the same result
+    as np.roll(a, -1) but without allocating a temporary array.
+
+    Parameters
+    ----------
+    a : `array`
+        Array to shift.
+    out : `array`
+        Preallocated array of the same shape as `a`.
+
+    Returns
+    -------
+    `array`
+        The `out` array, with out[j] = a[j+1] (periodic wrap).
+    """
+    out[..., -1] = a[..., 0]
+    out[..., :-1] = a[..., 1:]
+    return out
+
+def _fill_halo(u, halo):
+    r"""
+    Copies `u` into the interior of a halo buffer two cells wider and fills
+    the two ghost cells periodically. Afterwards halo[..., :-2] and
+    halo[..., 2:] are zero-copy views holding u[j-1] and u[j+1], replacing
+    the pair of shift copies that _roll_p1/_roll_m1 would make.
+
+    Parameters
+    ----------
+    u : `array`
+        Current solution.
+    halo : `array`
+        Preallocated buffer whose last axis is two cells longer than `u`.
+
+    Returns
+    -------
+    `array`
+        The `halo` array.
+    """
+    halo[..., 1:-1] = u
+    halo[..., 0] = u[..., -1]
+    halo[..., -1] = u[..., 0]
+    return halo
+
+def _lax_step(um, up, cc, out, scratch):
+    r"""
+    Fused Lax update 0.5*(up + um) - cc*(up - um), written into `out`
+    with np.ufunc out= calls so that no temporary arrays are allocated.
+
+    This is the closed form of the symbolic stencil
+
+        u_j^{n+1} = (u_{j+1} + u_{j-1})/2 - c*dt/(2*dx) * (u_{j+1} - u_{j-1})
+
+    with the Courant factor c*dt/(2*dx) folded into `cc` by the caller,
+    so `cc` may be an array on non-uniform grids.
+
+    Parameters
+    ----------
+    um : `array`
+        Function shifted one cell to the right, i.e. u[j-1].
+    up : `array`
+        Function shifted one cell to the left, i.e. u[j+1].
+    cc : `float` or `array`
+        Courant-like coefficient multiplying the gradient term.
+    out : `array`
+        Preallocated output array.
+    scratch : `array`
+        Preallocated work array of the same shape as `out`.
+
+    Returns
+    -------
+    `array`
+        The `out` array holding 0.5*(up + um) - cc*(up - um).
+    """
+    np.add(up, um, out=out)
+    out *= 0.5
+    np.subtract(up, um, out=scratch)
+    scratch *= cc
+    out -= scratch
+    return out
+
+def _get_array_module(backend):
+    r"""
+    Resolve the array module for a `backend` keyword: numpy for "numpy",
+    cupy for "cupy" (imported lazily, so cupy stays an optional
+    dependency).
+
+    Parameters
+    ----------
+    backend : `string`
+        Either "numpy" or "cupy".
+
+    Returns
+    -------
+    `module`
+        The array module implementing the numpy API.
+    """
+    if backend == "numpy":
+        return np
+    if backend == "cupy":
+        try:
+            import cupy
+        except ImportError as exc:
+            raise ImportError(
+                "backend='cupy' requires the optional cupy package"
+            ) from exc
+        return cupy
+    raise ValueError("unknown backend '%s'" % backend)
+
+def _asnumpy(arr):
+    r"""
+    Return `arr` as a numpy array, transferring from the GPU when it is a
+    cupy array and passing numpy arrays through unchanged.
+    """
+    return arr.get() if hasattr(arr, "get") else arr
+
+def _apply_wrap_bc(dst, src, lo, hi):
+    r"""
+    Write `src` into `dst` with its `lo`/`hi` edge points replaced by wrap
+    (periodic) boundary values. Equivalent to
+    np.pad(src[lo:len(src)-hi], (lo, hi), "wrap") but without allocating a
+    fresh array or going through np.pad's generic dispatch. `dst` may be
+    `src` itself, in which case only the edge points are written.
+
+    Parameters
+    ----------
+    dst : `array`
+        Destination array, same length as `src`.
+    src : `array`
+        Updated solution whose edge points hold stale values.
+    lo : `int`
+        Number of points to fill at the lower boundary.
+    hi : `int`
+        Number of points to fill at the upper boundary.
+
+    Returns
+    -------
+    `array`
+        The `dst` array.
+    """
+    n = src.shape[-1]
+    hi_stop = n - hi
+    if dst is not src:
+        dst[..., lo:hi_stop] = src[..., lo:hi_stop]
+    if lo:
+        dst[..., :lo] = src[..., hi_stop - lo:hi_stop]
+    if hi:
+        dst[..., hi_stop:] = src[..., lo:lo + hi]
+    return dst
+
 def deriv_dnw(xx, hh, **kwargs):
     """
     Returns the downwind 2nd order derivative of hh array respect to xx array.
@@ -32,8 +226,48 @@ def deriv_dnw(xx, hh, **kwargs):
 
     # Last point is ill calculated
 
-    # np.roll(hh, -1) is the same as hh[i+1]
-    hp = (np.roll(hh, -1) - hh) / (np.roll(xx, -1) - xx)
+    # np.roll(hh, -1) is the same as hh[i+1]; hh may carry leading batch axes
+    hp = (np.roll(hh, -1, axis=-1) - hh) / (np.roll(xx, -1) - xx)
+
+    return hp
+
+def _is_uniform(xx):
+    r"""
+    Return True when the grid `xx` is (numerically) uniformly spaced.
+    """
+
+    dxs = np.diff(xx)
+    return np.ptp(dxs) < 1e-12 * abs(dxs[0])
+
+def deriv_dnw_uniform(hh, inv_dx, out=None):
+    r"""
+    Downwind derivative of hh on a uniform grid with spacing 1/inv_dx.
+
+    Single fused subtract-multiply instead of rebuilding the grid spacing
+    from xx on every call. The wrapped last point uses the same scalar
+    spacing; it is ill calculated either way and normally overwritten by
+    the boundary handling.
+
+    Parameters
+    ----------
+    hh : `array`
+        Function sampled on the uniform grid.
+    inv_dx : `float`
+        Inverse of the grid spacing.
+    out : `array`
+        Optional preallocated output array.
+
+    Returns
+    -------
+    `array`
+        The downwind 2nd order derivative of hh. Last grid point is ill
+        calculated.
+    """
+
+    hp = np.empty(np.shape(hh)) if out is None else out
+    np.subtract(hh[..., 1:], hh[..., :-1], out=hp[..., :-1])
+    hp[..., -1] = hh[..., 0] - hh[..., -1]
+    hp *= inv_dx
 
     return hp
 
@@ -55,6 +289,12 @@ def order_conv(hh, hh2, hh4, **kwargs):
         The order of convergence.
     """
 
+    # Downsample onto the coarse grid (zero-copy slicing)
+    hh2c = hh2[::2]
+    hh4c = hh4[::4]
+
+    return np.log2(np.abs(hh - hh2c) / np.abs(hh2c - hh4c))
+
 def deriv_4tho(xx, hh, **kwargs):
     """
     Returns the 4th order derivative of hh respect to xx.
@@ -73,8 +313,20 @@ def deriv_4tho(xx, hh, **kwargs):
         Last and first two grid points are ill calculated.
     """
 
+    dx = xx[1] - xx[0]
+
+    # First and last two points are ill calculated
+    hp = np.empty(np.shape(hh))
+    hp[..., 2:-2] = (-hh[..., 4:] + 8 * hh[..., 3:-1]
+                     - 8 * hh[..., 1:-3] + hh[..., :-4]) / (12 * dx)
+    hp[..., :2] = np.nan
+    hp[..., -2:] = np.nan
+
+    return hp
+
 def step_adv_burgers(
-    xx, hh, a, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), **kwargs
+    xx, hh, a, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), dx_arr=None,
+    inv_dx=None, **kwargs
 ):
     r"""
     Right hand side of Burger's eq. where a can be a constant or a function
@@ -98,6 +350,13 @@ def step_adv_burgers(
     ddx : `lambda function`
         Allows to select the type of spatial derivative.
         By default lambda x,y: deriv_dnw(x, y)
+    dx_arr : `array`
+        Optional precomputed np.gradient(xx), so callers stepping in a loop
+        do not recompute it every time step.
+    inv_dx : `float`
+        Optional inverse grid spacing of a uniform grid; with the default
+        downwind stencil the derivative then takes the fused scalar-spacing
+        path (see deriv_dnw_uniform).
 
     Returns
     -------
@@ -106,9 +365,15 @@ def step_adv_burgers(
         Right hand side of (u^{n+1}-u^{n})/dt = from burgers eq, i.e., x \frac{\partial u}{\partial x}
     """
 
-    dt = cfl_adv_burger(a, xx) * cfl_cut
+    if dx_arr is None:
+        dt = cfl_adv_burger(a, xx) * cfl_cut
+    else:
+        dt = _cfl_adv_burger_pre(dx_arr, a) * cfl_cut
 
-    rhs = - a * ddx(xx, hh)
+    if inv_dx is not None and ddx is deriv_dnw:
+        rhs = - a * deriv_dnw_uniform(hh, inv_dx)
+    else:
+        rhs = - a * ddx(xx, hh)
 
     return dt, rhs
 
@@ -132,7 +397,89 @@ def cfl_adv_burger(a, x):
 
     dx = np.gradient(x)
 
-    return np.min(dx / np.abs(a)) 
+    # Scalar a: divide after the reduction instead of over the whole array
+    if np.ndim(a) == 0:
+        return dx.min() / abs(a)
+
+    return (dx / np.abs(a)).min()
+
+def _cfl_adv_burger_pre(dx_arr, a):
+    r"""
+    Same CFL condition as cfl_adv_burger, but with the grid spacing
+    `np.gradient(x)` precomputed once by the caller so the time loop does
+    not rebuild it every step.
+    """
+
+    if np.ndim(a) == 0:
+        return dx_arr.min() / abs(a)
+
+    return (dx_arr / np.abs(a)).min()
+
+@_maybe_njit
+def _evolv_adv_burgers_nb(xx, hh, nt, a, dt, bnd_lo, bnd_hi, save_every):
+    r"""
+    Compiled time-stepping loop of evolv_adv_burgers for a constant `a`,
+    a downwind derivative and wrap boundaries.
+
+    Parameters
+    ----------
+    xx : `array`
+        Spatial axis.
+    hh : `array`
+        Function that depends on xx.
+    nt : `int`
+        Number of time steps.
+    a : `float`
+        Constant which multiplies the right hand side of the Burger's eq.
+    dt : `float`
+        Time interval (constant for constant `a`).
+    bnd_lo : `int`
+        Number of boundary pixels at the lower end.
+    bnd_hi : `int`
+        Number of boundary pixels at the upper end.
+    save_every : `int`
+        Store the solution only every save_every time steps.
+
+    Returns
+    -------
+    t : `array`
+        time 1D array
+    unnt : `array`
+        Spatial and time evolution of u^n_j.
+    """
+    N = xx.shape[0]
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    unnt = np.zeros((n_save, N))
+    u = hh.copy()
+    u_next = np.empty(N)
+    tcur = 0.0
+    for j in range(N):
+        unnt[0, j] = hh[j]
+
+    for i in range(nt - 1):
+
+        for j in range(N):
+            jp = j + 1 if j < N - 1 else 0
+            rhs = -a * (u[jp] - u[j]) / (xx[jp] - xx[j])
+            u_next[j] = u[j] + rhs * dt
+
+        # Fix boundaries, same as np.pad(u_next[lo:N-hi], (lo, hi), "wrap")
+        for j in range(bnd_lo, N - bnd_hi):
+            u[j] = u_next[j]
+        for j in range(bnd_lo):
+            u[j] = u_next[N - bnd_hi - bnd_lo + j]
+        for j in range(bnd_hi):
+            u[N - bnd_hi + j] = u_next[bnd_lo + j]
+
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            k = (i + 1) // save_every
+            for j in range(N):
+                unnt[k, j] = u[j]
+            t[k] = tcur
+
+    return t, unnt
 
 def evolv_adv_burgers(
     xx,
@@ -140,9 +487,12 @@ def evolv_adv_burgers(
     nt,
     a,
     cfl_cut=0.98,
-    ddx=lambda x, y: deriv_dnw(x, y),
+    ddx=deriv_dnw,
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    save_every=1,
+    out=None,
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -157,13 +507,16 @@ def evolv_adv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     a : `float` or `array`
         Either constant, or array which multiply the right hand side of the Burger's eq.
     cfl_cut : `float`
         Constant value to limit dt from cfl_adv_burger.
     ddx : `lambda function`
         Allows to change the space derivative function.
-        By default lambda x,y: deriv_dnw(x, y).
+        By default deriv_dnw.
     bnd_type : `string`
         Allows to select the type of boundaries.
         By default 'wrap'.
@@ -171,39 +524,84 @@ def evolv_adv_burgers(
         Array of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1].
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
     t : `array`
         time 1D array
     unnt : `array`
-        Spatial and time evolution of u^n_j for n = (0,nt), and where j represents 
+        Spatial and time evolution of u^n_j for n = (0,nt), and where j represents
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # Compiled fast path: constant a, downwind derivative, wrap boundaries
+    if (_HAS_NUMBA and out is None and dtype is np.float64
+            and np.ndim(hh) == 1 and np.ndim(a) == 0
+            and ddx is deriv_dnw and bnd_type == "wrap"):
+        dt = cfl_adv_burger(a, xx) * cfl_cut
+        t, unnt = _evolv_adv_burgers_nb(
+            np.asarray(xx, dtype=float), np.asarray(hh, dtype=float),
+            nt, float(a), dt, bnd_limits[0], bnd_limits[1], save_every
+        )
+        return t, unnt.T
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
+
+    # Ping-pong state buffer; the history receives every save_every-th step
+    u_cur = np.array(hh, dtype=dtype)
+    tcur = 0.0
+
+    # a and xx are time-invariant, so the CFL time step is too
+    dt = cfl_adv_burger(a, xx) * cfl_cut
 
-    for i in range(0, nt-1): 
+    # Uniform grids with the default stencil take the fused scalar-spacing
+    # derivative; its ill-calculated wrapped point is overwritten by the
+    # boundary handling when at least one upper boundary point is kept
+    if ddx is deriv_dnw and bnd_limits[1] >= 1 and _is_uniform(xx):
+        inv_dx = 1.0 / (xx[1] - xx[0])
+    else:
+        inv_dx = None
 
-        dt, rhs = step_adv_burgers(xx, unnt[:, i], a=a, cfl_cut=cfl_cut, ddx=ddx)
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
-        # Compute next timestep
-        u_next = unnt[:, i] + rhs * dt 
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw / central scheme
+    for i in range(0, nt-1):
+
+        if inv_dx is not None:
+            rhs = - a * deriv_dnw_uniform(u_cur, inv_dx)
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+            rhs = - a * ddx(xx, u_cur)
 
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+        # Compute next timestep
+        u_next = u_cur + rhs * dt
+
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+        else:
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
-        t[i+1] = t[i] + dt
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
 
-    return t, unnt
+    return t, np.moveaxis(unnt, 0, -1)
 
 def deriv_upw(xx, hh, **kwargs):
     r"""
@@ -225,8 +623,38 @@ def deriv_upw(xx, hh, **kwargs):
 
     # Last point is ill calculated
 
-    # np.roll(hh, 1) is the same as hh[i-1]
-    hp = (hh - np.roll(hh, 1)) / (xx - np.roll(xx, 1))
+    # np.roll(hh, 1) is the same as hh[i-1]; hh may carry leading batch axes
+    hp = (hh - np.roll(hh, 1, axis=-1)) / (xx - np.roll(xx, 1))
+
+    return hp
+
+def deriv_upw_uniform(hh, inv_dx, out=None):
+    r"""
+    Upwind derivative of hh on a uniform grid with spacing 1/inv_dx.
+
+    Single fused subtract-multiply; see deriv_dnw_uniform. The wrapped
+    first point uses the same scalar spacing.
+
+    Parameters
+    ----------
+    hh : `array`
+        Function sampled on the uniform grid.
+    inv_dx : `float`
+        Inverse of the grid spacing.
+    out : `array`
+        Optional preallocated output array.
+
+    Returns
+    -------
+    `array`
+        The upwind 2nd order derivative of hh. First grid point is ill
+        calculated.
+    """
+
+    hp = np.empty(np.shape(hh)) if out is None else out
+    np.subtract(hh[..., 1:], hh[..., :-1], out=hp[..., 1:])
+    hp[..., 0] = hh[..., 0] - hh[..., -1]
+    hp *= inv_dx
 
     return hp
 
@@ -251,18 +679,125 @@ def deriv_cent(xx, hh, **kwargs):
     # First and last points are ill calculated
 
     # np.roll(hh, 1) for hh[i-1] and np.roll(hh, -1) for hh[i+1]
-    hp = (np.roll(hh, -1) - np.roll(hh, 1)) / (np.roll(xx, -1) - np.roll(xx, 1))
+    hp = (np.roll(hh, -1, axis=-1) - np.roll(hh, 1, axis=-1)) \
+        / (np.roll(xx, -1) - np.roll(xx, 1))
 
     return hp
 
+def deriv_cent_uniform(hh, inv_dx, out=None):
+    r"""
+    Centered derivative of hh on a uniform grid with spacing 1/inv_dx.
+
+    Single fused subtract-multiply; see deriv_dnw_uniform. The two
+    wrapped end points use the same scalar spacing.
+
+    Parameters
+    ----------
+    hh : `array`
+        Function sampled on the uniform grid.
+    inv_dx : `float`
+        Inverse of the grid spacing.
+    out : `array`
+        Optional preallocated output array.
+
+    Returns
+    -------
+    `array`
+        The centered 2nd order derivative of hh. First and last grid
+        points are ill calculated.
+    """
+
+    hp = np.empty(np.shape(hh)) if out is None else out
+    np.subtract(hh[..., 2:], hh[..., :-2], out=hp[..., 1:-1])
+    hp[..., 0] = hh[..., 1] - hh[..., -1]
+    hp[..., -1] = hh[..., 0] - hh[..., -2]
+    hp *= 0.5 * inv_dx
+
+    return hp
+
+@_maybe_njit
+def _evolv_uadv_burgers_nb(xx, hh, nt, dx_grad, bnd_lo, bnd_hi, save_every):
+    r"""
+    Compiled time-stepping loop of evolv_uadv_burgers for a downwind
+    derivative and wrap boundaries.
+
+    Parameters
+    ----------
+    xx : `array`
+        Spatial axis.
+    hh : `array`
+        Function that depends on xx.
+    nt : `int`
+        Number of time steps.
+    dx_grad : `array`
+        np.gradient(xx), precomputed once by the caller.
+    bnd_lo : `int`
+        Number of boundary pixels at the lower end.
+    bnd_hi : `int`
+        Number of boundary pixels at the upper end.
+    save_every : `int`
+        Store the solution only every save_every time steps.
+
+    Returns
+    -------
+    t : `array`
+        time 1D array
+    unnt : `array`
+        Spatial and time evolution of u^n_j.
+    """
+    N = xx.shape[0]
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    unnt = np.zeros((n_save, N))
+    u = hh.copy()
+    u_next = np.empty(N)
+    tcur = 0.0
+    for j in range(N):
+        unnt[0, j] = hh[j]
+
+    for i in range(nt - 1):
+
+        dt = np.inf
+        for j in range(N):
+            au = abs(u[j])
+            if au > 0.0:
+                r = dx_grad[j] / au
+                if r < dt:
+                    dt = r
+
+        for j in range(N):
+            jp = j + 1 if j < N - 1 else 0
+            rhs = -u[j] * (u[jp] - u[j]) / (xx[jp] - xx[j])
+            u_next[j] = u[j] + rhs * dt
+
+        # Fix boundaries, same as np.pad(u_next[lo:N-hi], (lo, hi), "wrap")
+        for j in range(bnd_lo, N - bnd_hi):
+            u[j] = u_next[j]
+        for j in range(bnd_lo):
+            u[j] = u_next[N - bnd_hi - bnd_lo + j]
+        for j in range(bnd_hi):
+            u[N - bnd_hi + j] = u_next[bnd_lo + j]
+
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            k = (i + 1) // save_every
+            for j in range(N):
+                unnt[k, j] = u[j]
+            t[k] = tcur
+
+    return t, unnt
+
 def evolv_uadv_burgers(
     xx,
     hh,
     nt,
     cfl_cut=0.98,
-    ddx=lambda x, y: deriv_dnw(x, y),
+    ddx=deriv_dnw,
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    save_every=1,
+    out=None,
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -278,6 +813,9 @@ def evolv_uadv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     cfl_cut : `float`
         constant value to limit dt from cfl_adv_burger.
         By default 0.98.
@@ -290,6 +828,15 @@ def evolv_uadv_burgers(
         List of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1]
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -300,38 +847,72 @@ def evolv_uadv_burgers(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # Compiled fast path: downwind derivative and wrap boundaries
+    if (_HAS_NUMBA and out is None and dtype is np.float64
+            and np.ndim(hh) == 1 and ddx is deriv_dnw and bnd_type == "wrap"):
+        t, unnt = _evolv_uadv_burgers_nb(
+            np.asarray(xx, dtype=float), np.asarray(hh, dtype=float),
+            nt, np.gradient(xx), bnd_limits[0], bnd_limits[1], save_every
+        )
+        return t, unnt.T
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
+
+    # Ping-pong state buffer; the history receives every save_every-th step
+    u_cur = np.array(hh, dtype=dtype)
+    tcur = 0.0
+
+    # Grid spacing is time-invariant; computed once for the CFL condition
+    dx_arr = np.gradient(xx)
+    # Uniform grids with the default stencil take the fused scalar-spacing
+    # derivative; see evolv_adv_burgers
+    if ddx is deriv_dnw and bnd_limits[1] >= 1 and _is_uniform(xx):
+        inv_dx = 1.0 / (xx[1] - xx[0])
+    else:
+        inv_dx = None
 
-    for i in range(0, nt-1): 
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
+    for i in range(0, nt-1):
 
-        dt, rhs = step_uadv_burgers(xx, unnt[:, i], cfl_cut=cfl_cut, ddx=ddx)
+        dt, rhs = step_uadv_burgers(xx, u_cur, cfl_cut=cfl_cut, ddx=ddx,
+                                    dx_arr=dx_arr, inv_dx=inv_dx)
 
         # Compute next timestep
-        u_next = unnt[:, i] + rhs * dt 
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw scheme
-        else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+        u_next = u_cur + rhs * dt
 
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+        else:
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
-        t[i+1] = t[i] + dt
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
 
-    return t, unnt 
+    return t, np.moveaxis(unnt, 0, -1)
 
 def evolv_Lax_uadv_burgers(
     xx: np.ndarray,
     hh: np.ndarray,
     nt: int,
     cfl_cut: float = 0.98,
-    ddx = lambda x, y: deriv_dnw(x, y),
+    ddx = deriv_dnw,
     bnd_type: str = "wrap",
     bnd_limits: tuple = [0, 1],
+    save_every: int = 1,
+    out: np.ndarray = None,
+    backend: str = "numpy",
+    dtype: type = np.float64,
     **kwargs
 ) -> tuple:
     r"""
@@ -348,6 +929,9 @@ def evolv_Lax_uadv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     nt : `int`
         Number of time steps.
     cfl_cut : `array`
@@ -362,6 +946,17 @@ def evolv_Lax_uadv_burgers(
         List of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1]
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    backend : `string`
+        "numpy" (default) or "cupy" to run the time loop on the GPU.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -372,29 +967,208 @@ def evolv_Lax_uadv_burgers(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # GPU path: same slice/ufunc operations on cupy arrays, one device
+    # to host transfer at the end
+    if backend != "numpy":
+        xp = _get_array_module(backend)
+        if bnd_type != "wrap":
+            raise NotImplementedError(
+                "backend='%s' supports wrap boundaries only" % backend
+            )
+        n_save = (nt - 1) // save_every + 1
+        t = np.zeros((n_save))
+        unnt = xp.zeros((n_save,) + np.shape(hh), dtype=dtype)
+        unnt[0] = xp.asarray(hh)
+        u_cur = xp.asarray(hh, dtype=dtype)
+        # Halo buffer: um/up are zero-copy views of the shifted solution
+        halo = xp.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+        um = halo[..., :-2]
+        up = halo[..., 2:]
+        cc = xp.empty(np.shape(hh), dtype=dtype)
+        scratch = xp.empty(np.shape(hh), dtype=dtype)
+        u_next = xp.empty(np.shape(hh), dtype=dtype)
+        inv_dx2 = xp.asarray(1.0 / (np.roll(xx, -1) - np.roll(xx, 1)))
+        dx_arr = xp.asarray(np.gradient(xx))
+        tcur = 0.0
+        for i in range(0, nt-1):
+            # The Lax update only needs the CFL dt; the rhs is unused
+            dt = float(_cfl_adv_burger_pre(dx_arr, u_cur))
+            _fill_halo(u_cur, halo)
+            np.multiply(u_cur, dt, out=cc)
+            cc *= inv_dx2
+            _lax_step(um, up, cc, u_next, scratch)
+            _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+            u_cur, u_next = u_next, u_cur
+            tcur += dt
+            if (i + 1) % save_every == 0:
+                unnt[(i + 1) // save_every] = u_cur
+                t[(i + 1) // save_every] = tcur
+        return t, np.moveaxis(_asnumpy(unnt), 0, -1)
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
+
+    # Ping-pong state buffer and scratch buffers for the shifted arrays
+    # and the fused update, allocated once
+    u_cur = np.array(hh, dtype=dtype)
+    # Halo buffer: um/up are zero-copy views of the shifted solution
+    halo = np.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+    um = halo[..., :-2]
+    up = halo[..., 2:]
+    cc = np.empty(np.shape(hh), dtype=dtype)
+    scratch = np.empty(np.shape(hh), dtype=dtype)
+    u_next = np.empty(np.shape(hh), dtype=dtype)
+    # Hoisted out of the time loop: the grid is time-invariant
+    inv_dx2 = 1.0 / (np.roll(xx, -1) - np.roll(xx, 1))
+    # Grid spacing is time-invariant; computed once for the CFL condition
+    dx_arr = np.gradient(xx)
+    tcur = 0.0
+
+    # Uniform grids with the default stencil take the fused scalar-spacing
+    # derivative; see evolv_adv_burgers
+    if ddx is deriv_dnw and bnd_limits[1] >= 1 and _is_uniform(xx):
+        inv_dx = 1.0 / (xx[1] - xx[0])
+    else:
+        inv_dx = None
 
-    for i in range(0, nt-1): 
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
-        dt, rhs = step_uadv_burgers(xx, unnt[:, i], cfl_cut=cfl_cut, ddx=ddx)
+    for i in range(0, nt-1):
+
+        dt, rhs = step_uadv_burgers(xx, u_cur, cfl_cut=cfl_cut, ddx=ddx,
+                                    dx_arr=dx_arr, inv_dx=inv_dx)
 
         # Compute next timestep
-        u_next = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) \
-            - unnt[:, i] * dt / (np.roll(xx, -1) - np.roll(xx, 1)) \
-            * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw scheme
+        _fill_halo(u_cur, halo)
+        np.multiply(u_cur, dt, out=cc)
+        cc *= inv_dx2
+        _lax_step(um, up, cc, u_next, scratch)
+
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
-
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
-        t[i+1] = t[i] + dt
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
+
+    return t, np.moveaxis(unnt, 0, -1)
+
+@_maybe_njit
+def _evolv_Lax_adv_burgers_tiled_nb(xx, hh, nt, a, dt, bnd_lo, bnd_hi, T, B,
+                                    save_every):
+    r"""
+    Time-tiled compiled loop of evolv_Lax_adv_burgers for a constant `a`,
+    a downwind derivative and wrap boundaries with at least one ghost cell
+    on each side.
+
+    Advances blocks of `T` consecutive timesteps over spatial tiles of `B`
+    cells so the tile stays hot in cache instead of streaming the whole
+    domain once per step. Tiles overlap by `T` halo cells on each side and
+    recompute them, so every tile works from the same snapshot and no
+    inter-tile synchronisation is needed within a block.
+
+    Parameters
+    ----------
+    xx : `array`
+        Spatial axis (uniform).
+    hh : `array`
+        Function that depends on xx.
+    nt : `int`
+        Number of iterations.
+    a : `float`
+        Constant advection velocity.
+    dt : `float`
+        Time interval from the CFL condition, constant over the run.
+    bnd_lo : `int`
+        Number of lower boundary points (>= 1).
+    bnd_hi : `int`
+        Number of upper boundary points (>= 1).
+    T : `int`
+        Timesteps per tile block.
+    B : `int`
+        Spatial cells per tile.
+    save_every : `int`
+        Store the solution only every save_every time steps (>= T).
+
+    Returns
+    -------
+    t : `array`
+        Time 1D array, one entry per stored step.
+    unnt : `array`
+        Stored history, shape (n_save, len(xx)).
+    """
+
+    N = xx.shape[0]
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros(n_save)
+    unnt = np.zeros((n_save, N))
+    unnt[0] = hh
+
+    # With the edge points refilled by the wrap boundary every step, the
+    # run is periodic over the P interior cells and the ghosts are their
+    # periodic images, so tiles can gather with plain modular indexing.
+    P = N - bnd_lo - bnd_hi
+    dx = xx[1] - xx[0]
+    c = a * dt / dx
+
+    u = hh.copy()
+    u_new = np.empty(N)
+    buf = np.empty(min(B, P) + 2 * T)
+    tcur = 0.0
+    i = 0
+
+    while i < nt - 1:
+        if i == 0:
+            # First step untiled: it must read the raw edge values of hh,
+            # which need not be wrap-consistent yet
+            for j in range(N):
+                jp = j + 1 if j < N - 1 else 0
+                jm = j - 1 if j > 0 else N - 1
+                u_new[j] = 0.5 * (u[jp] + u[jm]) - c * (u[jp] - u[j])
+            steps = 1
+        else:
+            steps = min(T, nt - 1 - i, save_every - i % save_every)
+            for s in range(0, P, B):
+                w = min(B, P - s)
+                m = w + 2 * steps
+                for k in range(m):
+                    buf[k] = u[bnd_lo + (s - steps + k) % P]
+                # Advance the tile; the valid region shrinks by one cell
+                # per step, and the stale left neighbour is carried over
+                for step in range(1, steps + 1):
+                    left = buf[step - 1]
+                    for k in range(step, m - step):
+                        unew = 0.5 * (buf[k + 1] + left) \
+                            - c * (buf[k + 1] - buf[k])
+                        left = buf[k]
+                        buf[k] = unew
+                for q in range(w):
+                    u_new[bnd_lo + s + q] = buf[steps + q]
+
+        # Fix boundaries, same as np.pad(u_new[lo:N-hi], (lo, hi), "wrap")
+        for q in range(bnd_lo):
+            u_new[q] = u_new[N - bnd_hi - bnd_lo + q]
+        for q in range(bnd_hi):
+            u_new[N - bnd_hi + q] = u_new[bnd_lo + q]
+
+        tmp = u
+        u = u_new
+        u_new = tmp
+        tcur += dt * steps
+        i += steps
+        if i % save_every == 0:
+            unnt[i // save_every] = u
+            t[i // save_every] = tcur
 
     return t, unnt
 
@@ -404,9 +1178,14 @@ def evolv_Lax_adv_burgers(
     nt,
     a,
     cfl_cut=0.98,
-    ddx=lambda x, y: deriv_dnw(x, y),
+    ddx=deriv_dnw,
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    save_every=1,
+    out=None,
+    block=(8, 4096),
+    backend="numpy",
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -423,6 +1202,9 @@ def evolv_Lax_adv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     nt : `int`
         Number of iterations
     a : `float` or `array`
@@ -432,7 +1214,7 @@ def evolv_Lax_adv_burgers(
         By default 0.98
     ddx : `lambda function`
         Allows to change the space derivative function.
-        By default lambda x,y: deriv_dnw(x, y)
+        By default deriv_dnw.
     bnd_type : `string`
         It allows to select the type of boundaries.
         By default 'wrap'
@@ -440,6 +1222,21 @@ def evolv_Lax_adv_burgers(
         Array of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1]
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    block : `tuple(int)`
+        (T, B) time-tiling block: T consecutive timesteps are advanced
+        over spatial tiles of B cells when the compiled tiled path
+        applies. By default (8, 4096).
+    backend : `string`
+        "numpy" (default) or "cupy" to run the time loop on the GPU.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -450,31 +1247,125 @@ def evolv_Lax_adv_burgers(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # GPU path: same slice/ufunc operations on cupy arrays, one device
+    # to host transfer at the end
+    if backend != "numpy":
+        xp = _get_array_module(backend)
+        if bnd_type != "wrap" or ddx is not deriv_dnw or np.ndim(a) != 0:
+            raise NotImplementedError(
+                "backend='%s' supports constant a, the default deriv_dnw "
+                "and wrap boundaries only" % backend
+            )
+        n_save = (nt - 1) // save_every + 1
+        t = np.zeros((n_save))
+        unnt = xp.zeros((n_save,) + np.shape(hh), dtype=dtype)
+        unnt[0] = xp.asarray(hh)
+        u_cur = xp.asarray(hh, dtype=dtype)
+        # Halo buffer: um/up are zero-copy views of the shifted solution
+        halo = xp.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+        um = halo[..., :-2]
+        up = halo[..., 2:]
+        scratch = xp.empty(np.shape(hh), dtype=dtype)
+        u_next = xp.empty(np.shape(hh), dtype=dtype)
+        # Downwind spacing and CFL dt, both time-invariant
+        dx_dnw = xp.asarray(np.roll(xx, -1) - xx)
+        dt = float(cfl_adv_burger(a, xx) * cfl_cut)
+        tcur = 0.0
+        for i in range(0, nt-1):
+            _fill_halo(u_cur, halo)
+            # rhs*dt = -a*dt*deriv_dnw(xx, u), with up already u[j+1]
+            np.subtract(up, u_cur, out=scratch)
+            scratch /= dx_dnw
+            scratch *= a * dt
+            np.add(up, um, out=u_next)
+            u_next *= 0.5
+            u_next -= scratch
+            _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+            u_cur, u_next = u_next, u_cur
+            tcur += dt
+            if (i + 1) % save_every == 0:
+                unnt[(i + 1) // save_every] = u_cur
+                t[(i + 1) // save_every] = tcur
+        return t, np.moveaxis(_asnumpy(unnt), 0, -1)
+
+    # Compiled time-tiled fast path: constant a on a uniform grid, downwind
+    # derivative, wrap boundaries with at least one ghost cell per side
+    # (otherwise the wrap refill is not periodic over the interior cells),
+    # and no stored samples finer than one block of timesteps
+    T, B = block
+    if (_HAS_NUMBA and out is None and dtype is np.float64
+            and np.ndim(hh) == 1 and np.ndim(a) == 0 and ddx is deriv_dnw
+            and bnd_type == "wrap" and bnd_limits[0] >= 1 and bnd_limits[1] >= 1
+            and T > 1 and save_every >= T
+            and np.ptp(np.diff(xx)) < 1e-12 * (xx[1] - xx[0])):
+        dt = cfl_adv_burger(a, xx) * cfl_cut
+        t, unnt = _evolv_Lax_adv_burgers_tiled_nb(
+            np.asarray(xx, dtype=float), np.asarray(hh, dtype=float),
+            nt, float(a), dt, bnd_limits[0], bnd_limits[1], T, B, save_every
+        )
+        return t, unnt.T
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
+
+    # Ping-pong state buffer and scratch buffers for the shifted arrays
+    # and the fused update, allocated once
+    u_cur = np.array(hh, dtype=dtype)
+    # Halo buffer: um/up are zero-copy views of the shifted solution
+    halo = np.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+    um = halo[..., :-2]
+    up = halo[..., 2:]
+    scratch = np.empty(np.shape(hh), dtype=dtype)
+    u_next = np.empty(np.shape(hh), dtype=dtype)
+    tcur = 0.0
+
+    # a and xx are time-invariant, so the CFL time step is too
+    dt = cfl_adv_burger(a, xx) * cfl_cut
 
-    for i in range(0, nt-1): 
+    # Uniform grids with the default stencil take the fused scalar-spacing
+    # derivative; see evolv_adv_burgers
+    if ddx is deriv_dnw and bnd_limits[1] >= 1 and _is_uniform(xx):
+        inv_dx = 1.0 / (xx[1] - xx[0])
+    else:
+        inv_dx = None
 
-        dt, rhs = step_adv_burgers(xx, unnt[:, i], a=a, cfl_cut=cfl_cut, ddx=ddx) 
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
-        # Compute next timestep
-        u_next = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) + rhs * dt 
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw scheme
+    for i in range(0, nt-1):
+
+        if inv_dx is not None:
+            rhs = - a * deriv_dnw_uniform(u_cur, inv_dx)
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+            rhs = - a * ddx(xx, u_cur)
 
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+        # Compute next timestep
+        _fill_halo(u_cur, halo)
+        np.add(up, um, out=u_next)
+        u_next *= 0.5
+        np.multiply(rhs, dt, out=scratch)
+        u_next += scratch
+
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+        else:
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
-        t[i+1] = t[i] + dt
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
 
-    return t, unnt
+    return t, np.moveaxis(unnt, 0, -1)
 
-def step_uadv_burgers(xx, hh, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), **kwargs):
+def step_uadv_burgers(xx, hh, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), dx_arr=None,
+                      inv_dx=None, **kwargs):
     r"""
     Right hand side of Burger's eq. where a is u, i.e hh.
 
@@ -494,6 +1385,13 @@ def step_uadv_burgers(xx, hh, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), **
     ddx : `lambda function`
         Allows to select the type of spatial derivative.
         By default lambda x,y: deriv_dnw(x, y)
+    dx_arr : `array`
+        Optional precomputed np.gradient(xx), so callers stepping in a loop
+        do not recompute it every time step.
+    inv_dx : `float`
+        Optional inverse grid spacing of a uniform grid; with the default
+        downwind stencil the derivative then takes the fused scalar-spacing
+        path (see deriv_dnw_uniform).
 
 
     Returns
@@ -508,10 +1406,16 @@ def step_uadv_burgers(xx, hh, cfl_cut=0.98, ddx=lambda x, y: deriv_dnw(x, y), **
 
     # Compute the time step
     # dt = cfl_adv_burger(a[:-1], xx)
-    dt = cfl_adv_burger(a, xx)
+    if dx_arr is None:
+        dt = cfl_adv_burger(a, xx)
+    else:
+        dt = _cfl_adv_burger_pre(dx_arr, a)
 
     # Compute the right hand side
-    rhs = -a * ddx(xx, hh)
+    if inv_dx is not None and ddx is deriv_dnw:
+        rhs = -a * deriv_dnw_uniform(hh, inv_dx)
+    else:
+        rhs = -a * ddx(xx, hh)
 
     return dt, rhs
 
@@ -534,7 +1438,69 @@ def cfl_diff_burger(a, x):
     """
 
     dx = np.gradient(x)
-    return np.min(dx**2 / (2 * np.abs(a))) 
+    return np.min(dx**2 / (2 * np.abs(a)))
+
+@_maybe_njit
+def _rusanov_step(u, dx_arr, dx, u_out):
+    r"""
+    Fused Rusanov update for one time step with periodic indexing.
+
+    Streams u once instead of materializing u_L/u_R/F_L/F_R/v_a/F_plus05/
+    F_int as separate full arrays, and folds the CFL reduction into the
+    same sweep.
+
+    The interface flux is the symbolic Rusanov expression
+
+        F_{j+1/2} = (u_j^2 + u_{j+1}^2)/4
+                    - max(|u_j|, |u_{j+1}|)/2 * (u_{j+1} - u_j)
+
+    and the update is u_j - dt*(F_{j+1/2} - F_{j-1/2})/dx.
+
+    Parameters
+    ----------
+    u : `array`
+        Current solution.
+    dx_arr : `array`
+        Precomputed np.gradient(xx) for the CFL condition.
+    dx : `float`
+        Uniform grid spacing used in the flux divergence.
+    u_out : `array`
+        Preallocated output array; must not alias `u`.
+
+    Returns
+    -------
+    `float`
+        The CFL time interval min(dx_arr / max(|u_j|, |u_j+1|)).
+    """
+
+    N = u.shape[0]
+
+    # CFL reduction first: dt is global, so it must be known before the
+    # update sweep can write u_out
+    dt = np.inf
+    for j in range(N):
+        jp = j + 1 if j < N - 1 else 0
+        v_a = max(abs(u[j]), abs(u[jp]))
+        if v_a > 0.0:
+            r = dx_arr[j] / v_a
+            if r < dt:
+                dt = r
+
+    # Fused flux + update sweep; F(j-1) is carried over as a scalar
+    u_m = u[N - 1]
+    u_0 = u[0]
+    F_m = 0.25 * (u_m * u_m + u_0 * u_0) \
+        - 0.5 * max(abs(u_m), abs(u_0)) * (u_0 - u_m)
+    for j in range(N):
+        jp = j + 1 if j < N - 1 else 0
+        u_j = u[j]
+        u_p = u[jp]
+        F_j = 0.25 * (u_j * u_j + u_p * u_p) \
+            - 0.5 * max(abs(u_j), abs(u_p)) * (u_p - u_j)
+        u_out[j] = u_j - dt * (F_j - F_m) / dx
+        F_m = F_j
+
+    return dt
 
 def evolv_Rie_uadv_burgers(
     xx: np.ndarray,
@@ -544,6 +1510,10 @@ def evolv_Rie_uadv_burgers(
     ddx = lambda x, y: deriv_upw(x, y),
     bnd_type: str = "wrap",
     bnd_limits: tuple = [1, 0],
+    save_every: int = 1,
+    out: np.ndarray = None,
+    backend: str = "numpy",
+    dtype: type = np.float64,
     **kwargs
 ) -> tuple:
     r"""
@@ -559,6 +1529,9 @@ def evolv_Rie_uadv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     nt : `int`
         Number of iterations
     cfl_cut : `float`
@@ -574,6 +1547,17 @@ def evolv_Rie_uadv_burgers(
         Array of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [1,0]
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    backend : `string`
+        "numpy" (default) or "cupy" to run the time loop on the GPU.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -584,44 +1568,108 @@ def evolv_Rie_uadv_burgers(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # GPU path: same slice/ufunc operations on cupy arrays, one device
+    # to host transfer at the end
+    if backend != "numpy":
+        xp = _get_array_module(backend)
+        if bnd_type != "wrap":
+            raise NotImplementedError(
+                "backend='%s' supports wrap boundaries only" % backend
+            )
+        n_save = (nt - 1) // save_every + 1
+        t = np.zeros((n_save))
+        unnt = xp.zeros((n_save,) + np.shape(hh), dtype=dtype)
+        unnt[0] = xp.asarray(hh)
+        dx = xx[1] - xx[0]
+        u_cur = xp.asarray(hh, dtype=dtype)
+        u_R = xp.empty(np.shape(hh), dtype=dtype)
+        F_m = xp.empty(np.shape(hh), dtype=dtype)
+        dx_arr = xp.asarray(np.gradient(xx))
+        tcur = 0.0
+        for i in range(0, nt-1):
+            u_L = u_cur
+            _roll_m1(u_cur, u_R)
+            F_L = 0.5 * u_L**2
+            F_R = 0.5 * u_R**2
+            v_a = np.maximum(np.abs(u_L), np.abs(u_R))
+            F_plus05 = 0.5 * (F_L + F_R) - 0.5 * v_a * (u_R - u_L)
+            F_int = (F_plus05 - _roll_p1(F_plus05, F_m)) / dx
+            dt = float(_cfl_adv_burger_pre(dx_arr, v_a))
+            u_next = u_cur - dt * F_int
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+            tcur += dt
+            if (i + 1) % save_every == 0:
+                unnt[(i + 1) // save_every] = u_cur
+                t[(i + 1) // save_every] = tcur
+        return t, np.moveaxis(_asnumpy(unnt), 0, -1)
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
 
     dx = xx[1] - xx[0]
 
+    # Ping-pong state buffer and scratch buffers for the shifted arrays,
+    # allocated once
+    u_cur = np.array(hh, dtype=dtype)
+    u_R = np.empty(np.shape(hh), dtype=dtype)
+    F_m = np.empty(np.shape(hh), dtype=dtype)
+    # Grid spacing is time-invariant; computed once for the CFL condition
+    dx_arr = np.gradient(xx)
+    tcur = 0.0
+
+    # Compiled fast path: one fused sweep over u per step (wrap boundaries)
+    if (_HAS_NUMBA and dtype is np.float64 and np.ndim(hh) == 1
+            and bnd_type == "wrap"):
+        u_next = np.empty(len(xx))
+        for i in range(0, nt-1):
+            dt = _rusanov_step(u_cur, dx_arr, dx, u_next)
+            _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+            u_cur, u_next = u_next, u_cur
+            tcur += dt
+            if (i + 1) % save_every == 0:
+                unnt[(i + 1) // save_every] = u_cur
+                t[(i + 1) // save_every] = tcur
+        return t, unnt.T
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
     for i in range(0, nt-1):
 
-        # 1. Compute u_L and u_R    
-        u_L = np.roll(unnt[:, i], 0) 
-        u_R = np.roll(unnt[:, i], -1) 
+        # 1. Compute u_L and u_R
+        u_L = u_cur
+        _roll_m1(u_cur, u_R)
 
         # 2. Compute corresponding fluxes
         F_L = 0.5 * u_L**2
-        F_R = 0.5 * u_R**2 
+        F_R = 0.5 * u_R**2
 
         # 3. Compute the propagation speed
-        v_a = np.maximum(np.abs(u_L), np.abs(u_R)) 
+        v_a = np.maximum(np.abs(u_L), np.abs(u_R))
 
         # 4. Compute the interface fluxes (Rusanov)
         F_plus05 = 0.5 * (F_L + F_R) - 0.5 * v_a * (u_R - u_L) # [i+1/2]
-        F_int = (F_plus05 - np.roll(F_plus05, 1)) / dx 
-        
+        F_int = (F_plus05 - _roll_p1(F_plus05, F_m)) / dx
+
         # 5. Advance the solution in time
-        dt = cfl_adv_burger(v_a, xx)
-        u_next = unnt[:, i] - dt * F_int  
+        dt = _cfl_adv_burger_pre(dx_arr, v_a)
+        u_next = u_cur - dt * F_int
 
-        # Boundary conditions 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0]:-bnd_limits[1]]  # dnw scheme
+        # Boundary conditions: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
         else:
-            u_next_temp = u_next[bnd_limits[0]:] # upw scheme
-
-        # Update the solution
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
-        t[i+1] = t[i] + dt
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
 
-    return t, unnt
+    return t, np.moveaxis(unnt, 0, -1)
 
 def evolve_Lax_Rie_uadv_burgers(
     xx: np.ndarray,
@@ -631,6 +1679,10 @@ def evolve_Lax_Rie_uadv_burgers(
     ddx = lambda x, y: deriv_upw(x, y),
     bnd_type: str = "wrap",
     bnd_limits: tuple = [1, 0],
+    save_every: int = 1,
+    out: np.ndarray = None,
+    backend: str = "numpy",
+    dtype: type = np.float64,
     **kwargs
 ) -> tuple:
     r"""
@@ -646,6 +1698,9 @@ def evolve_Lax_Rie_uadv_burgers(
         Spatial axis.
     hh : `array`
         Function that depends on xx.
+        A 2D array of shape (K, N) evolves K independent initial
+        conditions in one batched run (wrap boundaries only);
+        the history then has shape (K, N, n_save).
     nt : `int`
         Number of iterations
     cfl_cut : `float`
@@ -661,6 +1716,17 @@ def evolve_Lax_Rie_uadv_burgers(
         Array of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [1,0]
+    save_every : `int`
+        Store the solution only every save_every time steps.
+        By default 1 (store all).
+    out : `array`
+        Optional preallocated array to store the history into.
+    backend : `string`
+        "numpy" (default) or "cupy" to run the time loop on the GPU.
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -671,62 +1737,119 @@ def evolve_Lax_Rie_uadv_burgers(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # GPU path: same slice/ufunc operations on cupy arrays, one device
+    # to host transfer at the end; the limiter is written with nested
+    # two-argument minimums, which cupy supports
+    if backend != "numpy":
+        xp = _get_array_module(backend)
+        if bnd_type != "wrap":
+            raise NotImplementedError(
+                "backend='%s' supports wrap boundaries only" % backend
+            )
+        n_save = (nt - 1) // save_every + 1
+        t = np.zeros((n_save))
+        unnt = xp.zeros((n_save,) + np.shape(hh), dtype=dtype)
+        unnt[0] = xp.asarray(hh)
+        dx = xx[1] - xx[0]
+        u_cur = xp.asarray(hh, dtype=dtype)
+        # Halo buffer: um/u_R are zero-copy views of the shifted solution
+        halo = xp.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+        um = halo[..., :-2]
+        u_R = halo[..., 2:]
+        F_m = xp.empty(np.shape(hh), dtype=dtype)
+        inv_dx2 = xp.asarray(1.0 / (np.roll(xx, -1) - np.roll(xx, 1)))
+        dx_arr = xp.asarray(np.gradient(xx))
+        tcur = 0.0
+        for i in range(0, nt-1):
+            u_L = u_cur
+            _fill_halo(u_cur, halo)
+            F_L = 0.5 * u_L**2
+            F_R = 0.5 * u_R**2
+            v_a = np.maximum(np.abs(u_L), np.abs(u_R))
+            dt = float(_cfl_adv_burger_pre(dx_arr, v_a))
+            F_Rie = 0.5 * (F_L + F_R) - 0.5 * v_a * (u_R - u_L)
+            F_Lax = 0.5 * (u_R + um) - u_cur * dt * inv_dx2 * (u_R - um)
+            r = (u_L - um) / (u_R + u_L)
+            phi = np.maximum(
+                0., np.minimum(np.minimum(2.*r, (1. + r)/2.), 2.)
+            )
+            F_Lax_Rie = F_Rie + phi * (F_Lax - F_Rie)
+            u_next = u_cur - dt * (F_Lax_Rie - _roll_p1(F_Lax_Rie, F_m)) / dx
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
+            tcur += dt
+            if (i + 1) % save_every == 0:
+                unnt[(i + 1) // save_every] = u_cur
+                t[(i + 1) // save_every] = tcur
+        return t, np.moveaxis(_asnumpy(unnt), 0, -1)
+
+    n_save = (nt - 1) // save_every + 1
+    t = np.zeros((n_save))
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((n_save,) + np.shape(hh), dtype=dtype) if out is None else out
+    unnt[0] = hh
 
     dx = xx[1] - xx[0]
 
     def flux_limiter(r):
-        thetas = np.array([1., 2.])
-        mins = np.zeros((len(thetas), len(r)))
-        for i, theta in enumerate(thetas):
-            mins[i] = np.min(( np.min(theta * r), np.min((1. + r)/2.), theta ))
-        phi = np.max((0, np.max(mins)))
-        return phi
+        # Per-cell limiter: phi = max(0, min(2r, (1+r)/2, 2)), vectorized
+        return np.maximum(0., np.minimum.reduce([2.*r, (1. + r)/2., 2.*np.ones_like(r)]))
+
+    # Ping-pong state buffer and scratch buffers for the shifted arrays,
+    # allocated once
+    u_cur = np.array(hh, dtype=dtype)
+    # Halo buffer: um/u_R are zero-copy views of the shifted solution
+    halo = np.empty(np.shape(hh)[:-1] + (np.shape(hh)[-1] + 2,), dtype=dtype)
+    um = halo[..., :-2]
+    u_R = halo[..., 2:]
+    F_m = np.empty(np.shape(hh), dtype=dtype)
+    # Hoisted out of the time loop: the grid is time-invariant
+    inv_dx2 = 1.0 / (np.roll(xx, -1) - np.roll(xx, 1))
+    dx_arr = np.gradient(xx)
+    tcur = 0.0
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
     for i in range(0, nt-1):
 
-        # Compute u_L and u_R    
-        u_L = np.roll(unnt[:, i], 0)  # u[i]
-        u_R = np.roll(unnt[:, i], -1) # u[i+1]
+        # Compute u_L and u_R
+        u_L = u_cur                               # u[i]
+        _fill_halo(u_cur, halo)                   # u_R = u[i+1], um = u[i-1]
 
         # Compute corresponding fluxes
         F_L = 0.5 * u_L**2
-        F_R = 0.5 * u_R**2 
+        F_R = 0.5 * u_R**2
 
         # Compute the propagation speed
-        v_a = np.maximum(np.abs(u_L), np.abs(u_R)) 
-        dt = cfl_adv_burger(v_a, xx)
+        v_a = np.maximum(np.abs(u_L), np.abs(u_R))
+        dt = _cfl_adv_burger_pre(dx_arr, v_a)
 
         # Compute the Riemann flux
         F_Rie = 0.5 * (F_L + F_R) - 0.5 * v_a * (u_R - u_L) # [i+1/2]
 
         # Compute the Lax flux
-        unnt_Lax = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) \
-            - unnt[:, i] * dt / (np.roll(xx, -1) - np.roll(xx, 1)) \
-            * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))
+        unnt_Lax = 0.5 * (u_R + um) - u_cur * dt * inv_dx2 * (u_R - um)
         F_Lax = unnt_Lax
 
         # Compute the Lax-Rie flux
-        r = (u_L - np.roll(unnt[:, i], 1)) / (u_R + u_L)
+        r = (u_L - um) / (u_R + u_L)
         F_Lax_Rie = F_Rie + flux_limiter(r) * (F_Lax - F_Rie)
 
         # 5. Advance the solution in time
-        u_next = unnt[:, i] - dt * (F_Lax_Rie - np.roll(F_Lax_Rie, 1)) / dx 
+        u_next = u_cur - dt * (F_Lax_Rie - _roll_p1(F_Lax_Rie, F_m)) / dx
 
-        # Boundary conditions 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0]:-bnd_limits[1]]  # dnw scheme
+        # Boundary conditions: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            u_cur = _apply_wrap_bc(u_next, u_next, bnd_limits[0], bnd_limits[1])
         else:
-            u_next_temp = u_next[bnd_limits[0]:] # upw scheme
+            u_cur = np.pad(u_next[slc], bnd_limits, bnd_type)
+        tcur += dt
+        if (i + 1) % save_every == 0:
+            unnt[(i + 1) // save_every] = u_cur
+            t[(i + 1) // save_every] = tcur
 
-
-        # Update the solution
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
-        t[i+1] = t[i] + dt
-
-    return t, unnt
+    return t, np.moveaxis(unnt, 0, -1)
 
 def ops_Lax_LL_Add(
     xx,
@@ -738,6 +1861,7 @@ def ops_Lax_LL_Add(
     ddx=lambda x, y: deriv_dnw(x, y),
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -775,6 +1899,10 @@ def ops_Lax_LL_Add(
         List of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1]
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -785,37 +1913,78 @@ def ops_Lax_LL_Add(
         all the elements of the domain.
     """
     t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
-
-    for i in range(0, nt-1): 
-
-        dt_u, rhs_u = step_adv_burgers(xx, unnt[:, i], a, cfl_cut=cfl_cut, ddx=ddx)
-        dt_v, rhs_v = step_adv_burgers(xx, unnt[:, i], b, cfl_cut=cfl_cut, ddx=ddx)
-        
-        # Calculate timestep
-        dt = np.min([dt_v, dt_u]) * 0.5 # XXX ADD 0.5 HERE
-
-        dx = xx[1] - xx[0]
-
-        # Compute next timestep
-        # XXX ADD RHS MANUALLY AND FIX IT ACCORDING TO WIKI
-        unn = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) - ((a*dt) / (2*dx) * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))) #+ rhs_u * dt
-        vnn = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) - ((b*dt) / (2*dx) * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))) #+ rhs_v * dt
-        u_next = unn + vnn - (0.5 * np.roll(unnt[:, i], -1) + 0.5 * np.roll(unnt[:, i], 1)) # unnt[:, i] # MADE STABLE by taking the surrounding half steps
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw/centr scheme
-        else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((nt, len(xx)), dtype=dtype)
+    unnt[0] = hh
+
+    # Halo buffer (um/up are zero-copy views of the shifted solution) and
+    # scratch buffers for the fused updates, allocated once
+    halo = np.empty(len(xx) + 2, dtype=dtype)
+    um = halo[:-2]
+    up = halo[2:]
+    unn = np.empty(len(xx), dtype=dtype)
+    vnn = np.empty(len(xx), dtype=dtype)
+    scratch = np.empty(len(xx), dtype=dtype)
+    scratch2 = np.empty(len(xx), dtype=dtype)
+    u_next = np.empty(len(xx), dtype=dtype)
+
+    # Grid spacing is time-invariant; hoisted out of the loop
+    dx = xx[1] - xx[0]
 
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+    # a, b and xx are time-invariant, so the CFL time steps are too.
+    # The rhs from step_adv_burgers is unused (commented out below), so the
+    # per-step calls are dropped altogether.
+    dt_u = cfl_adv_burger(a, xx) * cfl_cut
+    dt_v = cfl_adv_burger(b, xx) * cfl_cut
+    dt = min(dt_v, dt_u) * 0.5 # XXX ADD 0.5 HERE
+
+    cc_u = (a*dt) / (2*dx)
+    cc_v = (b*dt) / (2*dx)
+
+    # The u and v substeps read the same shifted arrays and write disjoint
+    # buffers, so on large grids they run concurrently on two threads
+    # (numpy ufuncs release the GIL). For small grids the submit/join
+    # overhead outweighs the kernels, so the substeps stay serial.
+    pool = ThreadPoolExecutor(max_workers=2) if len(xx) >= 16384 else None
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
+    try:
+        for i in range(0, nt-1):
+
+            # Compute next timestep
+            # XXX ADD RHS MANUALLY AND FIX IT ACCORDING TO WIKI
+            _fill_halo(unnt[i], halo)
+            if pool is not None:
+                f_u = pool.submit(_lax_step, um, up, cc_u, unn, scratch)
+                f_v = pool.submit(_lax_step, um, up, cc_v, vnn, scratch2)
+                f_u.result()
+                f_v.result()
+            else:
+                _lax_step(um, up, cc_u, unn, scratch) #+ rhs_u * dt
+                _lax_step(um, up, cc_v, vnn, scratch2) #+ rhs_v * dt
+            # MADE STABLE by taking the surrounding half steps
+            np.add(unn, vnn, out=u_next)
+            np.multiply(up, 0.5, out=scratch)
+            np.multiply(um, 0.5, out=scratch2)
+            scratch += scratch2
+            u_next -= scratch
+
+            # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+            if bnd_type == "wrap":
+                _apply_wrap_bc(unnt[i+1], u_next, bnd_limits[0], bnd_limits[1])
+            else:
+                unnt[i+1] = np.pad(u_next[slc], bnd_limits, bnd_type)
 
-        # Update time
-        t[i+1] = t[i] + dt
+            # Update time
+            t[i+1] = t[i] + dt
+    finally:
+        if pool is not None:
+            pool.shutdown()
 
-    return t, unnt
+    return t, unnt.T
 
 def ops_Lax_LL_Lie(
     xx,
@@ -827,6 +1996,7 @@ def ops_Lax_LL_Lie(
     ddx=lambda x, y: deriv_dnw(x, y),
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -863,6 +2033,10 @@ def ops_Lax_LL_Lie(
         List of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
         By default [0,1]
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -873,41 +2047,110 @@ def ops_Lax_LL_Lie(
         all the elements of the domain.
     """
     t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
-    vnnt = np.zeros((len(xx), nt))
-    vnnt[:, 0] = hh
+    # Time-major layout: vnnt[i] is a contiguous row; transposed on return.
+    # Only the returned history is kept; the first split stage lives in a
+    # 1D buffer that is overwritten every step.
+    vnnt = np.zeros((nt, len(xx)), dtype=dtype)
+    vnnt[0] = hh
+
+    # Halo buffer (um/up are zero-copy views of the shifted solution), the
+    # first split stage and the fused-update scratch, allocated once
+    halo = np.empty(len(xx) + 2, dtype=dtype)
+    um = halo[:-2]
+    up = halo[2:]
+    unn = np.empty(len(xx), dtype=dtype)
+    scratch = np.empty(len(xx), dtype=dtype)
+
+    # Grid spacing is time-invariant; hoisted out of the loop
+    dx = xx[1] - xx[0]
 
-    for i in range(0, nt-1): 
+    # a, b and xx are time-invariant, so the CFL time steps are too
+    dt_u = cfl_adv_burger(a, xx) * cfl_cut
+    dt_v = cfl_adv_burger(b, xx) * cfl_cut
+    dt = min(dt_u, dt_v) * 0.5 # XXX ADD 0.5 HERE
 
-        dt_u = cfl_adv_burger(a, xx) * cfl_cut
-        dt_v = cfl_adv_burger(b, xx) * cfl_cut
-        dt = np.min([dt_u, dt_v]) * 0.5 # XXX ADD 0.5 HERE
+    cc_u = (a*dt) / (2*dx)
+    cc_v = (b*dt) / (2*dx)
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
+    for i in range(0, nt-1):
 
-        dx = xx[1] - xx[0]
-        
         # _, rhs_u = step_adv_burgers(xx, unnt, a=a, cfl_cut=cfl_cut, ddx=ddx)
 
-        unnt[:, i] = 0.5 * (np.roll(vnnt[:, i], -1) + np.roll(vnnt[:, i], 1)) - ((a*dt) / (2*dx) * (np.roll(vnnt[:, i], -1) - np.roll(vnnt[:, i], 1))) # + rhs_u * dt 
+        _fill_halo(vnnt[i], halo)
+        _lax_step(um, up, cc_u, unn, scratch) # + rhs_u * dt
 
-        # _, rhs_v = step_adv_burgers(xx, unnt[:, i], a=b, cfl_cut=cfl_cut, ddx=ddx)
-        
-        vnnt[:, i] = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) - ((b*dt) / (2*dx) * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))) # + rhs_v * dt
-                
-        u_next = vnnt[:, i] #unn + vnn - unnt[:, i]
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw/centr scheme
-        else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+        # _, rhs_v = step_adv_burgers(xx, unn, a=b, cfl_cut=cfl_cut, ddx=ddx)
 
-        vnnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+        _fill_halo(unn, halo)
+        # Second stage written straight into the history row
+        _lax_step(um, up, cc_v, vnnt[i], scratch) # + rhs_v * dt
+
+        u_next = vnnt[i] #unn + vnn - unnt[i]
+
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            _apply_wrap_bc(vnnt[i+1], u_next, bnd_limits[0], bnd_limits[1])
+        else:
+            vnnt[i+1] = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
         t[i+1] = t[i] + dt
 
-    return t, vnnt
+    return t, vnnt.T
+
+@_maybe_njit
+def _ops_Strang_step_nb(w, cc_a, cc_b, unn, out):
+    r"""
+    Fused Strang-split Lax step: the three half-step stages of
+    ops_Lax_LL_Strang walked in two sweeps with periodic indexing instead
+    of three _lax_step passes over freshly filled halo views.
+
+    The first sweep writes the first stage into `unn`; the second and
+    third stages are fused, carrying the three live values of the middle
+    stage in scalars so it never touches memory.
+
+    Parameters
+    ----------
+    w : `array`
+        Current solution.
+    cc_a : `float`
+        Courant factor of the outer half steps, a*dt/(4*dx).
+    cc_b : `float`
+        Courant factor of the middle step, b*dt/(2*dx).
+    unn : `array`
+        Preallocated buffer for the first stage.
+    out : `array`
+        Output array; may alias `w`.
+
+    Returns
+    -------
+    `array`
+        The `out` array holding the third stage.
+    """
+    N = w.shape[0]
+
+    # Stage 1: Lax step of w with cc_a
+    for j in range(N):
+        jp = j + 1 if j < N - 1 else 0
+        jm = j - 1 if j > 0 else N - 1
+        unn[j] = 0.5 * (w[jp] + w[jm]) - cc_a * (w[jp] - w[jm])
+
+    # Stages 2+3 fused: v(k) is the Lax step of unn with cc_b; out[j]
+    # needs v(j-1) and v(j+1), so the window v_m/v_c/v_p rolls along
+    v_m = 0.5 * (unn[0] + unn[N - 2]) - cc_b * (unn[0] - unn[N - 2])
+    v_c = 0.5 * (unn[1] + unn[N - 1]) - cc_b * (unn[1] - unn[N - 1])
+    for j in range(N):
+        k = j + 2 if j < N - 2 else j + 2 - N
+        v_p = 0.5 * (unn[k] + unn[j]) - cc_b * (unn[k] - unn[j])
+        out[j] = 0.5 * (v_p + v_m) - cc_a * (v_p - v_m)
+        v_m = v_c
+        v_c = v_p
+
+    return out
 
 def ops_Lax_LL_Strang(
     xx,
@@ -919,6 +2162,7 @@ def ops_Lax_LL_Strang(
     ddx=lambda x, y: deriv_dnw(x, y),
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -956,6 +2200,10 @@ def ops_Lax_LL_Strang(
     bnd_limits : `list(int)`
         The number of pixels that will need to be updated with the boundary information.
         By default [0,1]
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -966,44 +2214,66 @@ def ops_Lax_LL_Strang(
         all the elements of the domain.
     """
     t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh 
-    vnnt = np.zeros((len(xx), nt))
-    vnnt[:, 0] = hh
-    wnnt = np.zeros((len(xx), nt))
-    wnnt[:, 0] = hh
-    
-    for i in range(0, nt-1): 
+    # Time-major layout: wnnt[i] is a contiguous row; transposed on return.
+    # Only the returned history is kept; the two intermediate split stages
+    # live in 1D buffers that are overwritten every step.
+    wnnt = np.zeros((nt, len(xx)), dtype=dtype)
+    wnnt[0] = hh
+
+    # Halo buffer (um/up are zero-copy views of the shifted solution), the
+    # two intermediate split stages and the fused-update scratch, allocated
+    # once
+    halo = np.empty(len(xx) + 2, dtype=dtype)
+    um = halo[:-2]
+    up = halo[2:]
+    unn = np.empty(len(xx), dtype=dtype)
+    vnn = np.empty(len(xx), dtype=dtype)
+    scratch = np.empty(len(xx), dtype=dtype)
+
+    # Grid spacing is time-invariant; hoisted out of the loop
+    dx = xx[1] - xx[0]
 
-        # Calculate timestep
-        dt_u = cfl_adv_burger(a, xx) * cfl_cut
-        dt_v = cfl_adv_burger(b, xx) * cfl_cut
+    # a, b and xx are time-invariant, so the CFL time steps are too
+    dt_u = cfl_adv_burger(a, xx) * cfl_cut
+    dt_v = cfl_adv_burger(b, xx) * cfl_cut
+    dt = min(dt_u, dt_v) * 0.5 # XXX ADD 0.5 HERE
 
-        dt = np.min([dt_u, dt_v]) * 0.5 # XXX ADD 0.5 HERE
-        dx = xx[1] - xx[0]
+    cc_a = (a*dt) / (4*dx)
+    cc_b = (b*dt) / (2*dx)
 
-        # Advance half a timestep:
-        unnt[:, i] = 0.5 * (np.roll(wnnt[:, i], -1) + np.roll(wnnt[:, i], 1)) - ((a*dt) / (4*dx) * (np.roll(wnnt[:, i], -1) - np.roll(wnnt[:, i], 1)))#+ rhs_u * dt * 0.5 # XXX w here
-        
-        # Advance half a timestep:
-        vnnt[:, i] = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) - ((b*dt) / (2*dx) * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1))) #+ rhs_v * dt * 0.5 # XXX u at t+1/2
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
-        # Advance half a timestep:
-        wnnt[:, i] = 0.5 * (np.roll(vnnt[:, i], -1) + np.roll(vnnt[:, i], 1)) - ((a*dt) / (4*dx) * (np.roll(vnnt[:, i], -1) - np.roll(vnnt[:, i], 1)))#+ rhs_w * dt * 0.5 # XXX v here
+    for i in range(0, nt-1):
 
-        u_next = wnnt[:, i]
-        
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw/centr scheme
+        if _HAS_NUMBA and dtype is np.float64:
+            # All three half steps in one compiled call
+            _ops_Strang_step_nb(wnnt[i], cc_a, cc_b, unn, wnnt[i])
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
+            # Advance half a timestep:
+            _fill_halo(wnnt[i], halo)
+            _lax_step(um, up, cc_a, unn, scratch) #+ rhs_u * dt * 0.5 # XXX w here
+
+            # Advance half a timestep:
+            _fill_halo(unn, halo)
+            _lax_step(um, up, cc_b, vnn, scratch) #+ rhs_v * dt * 0.5 # XXX u at t+1/2
 
-        wnnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+            # Advance half a timestep, written straight into the history row:
+            _fill_halo(vnn, halo)
+            _lax_step(um, up, cc_a, wnnt[i], scratch) #+ rhs_w * dt * 0.5 # XXX v here
+
+        u_next = wnnt[i]
+        
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            _apply_wrap_bc(wnnt[i+1], u_next, bnd_limits[0], bnd_limits[1])
+        else:
+            wnnt[i+1] = np.pad(u_next[slc], bnd_limits, bnd_type)
         # Update time
-        t[i+1] = t[i] + dt 
+        t[i+1] = t[i] + dt
 
-    return t, wnnt # return w
+    return t, wnnt.T # return w
 
 def ops_Lax_LH_Strang(
     xx,
@@ -1015,6 +2285,7 @@ def ops_Lax_LH_Strang(
     ddx=lambda x, y: deriv_dnw(x, y),
     bnd_type="wrap",
     bnd_limits=[0, 1],
+    dtype=np.float64,
     **kwargs
 ):
     r"""
@@ -1053,6 +2324,10 @@ def ops_Lax_LH_Strang(
         Array of two integer elements. The number of pixels that
         will need to be updated with the boundary information.
 #         By default [0,1]
+    dtype : `type`
+        Floating dtype of the state and history arrays. float32 halves
+        the memory traffic at the cost of precision; by default
+        np.float64.
 
     Returns
     -------
@@ -1063,49 +2338,98 @@ def ops_Lax_LH_Strang(
         all the elements of the domain.
     """
     t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
-    vnnt = np.zeros((len(xx), nt))
-    vnnt[:, 0] = hh
-    wnnt = np.zeros((len(xx), nt))
-    wnnt[:, 0] = hh
+    # Time-major layout: wnnt[i] is a contiguous row; transposed on return.
+    # Only the returned history is kept; the two intermediate split stages
+    # live in 1D buffers that are overwritten every step.
+    wnnt = np.zeros((nt, len(xx)), dtype=dtype)
+    wnnt[0] = hh
+
+    # Halo buffer (um/up are zero-copy views of the shifted solution), the
+    # two intermediate split stages and the fused-update scratch, allocated
+    # once
+    halo = np.empty(len(xx) + 2, dtype=dtype)
+    um = halo[:-2]
+    up = halo[2:]
+    unn = np.empty(len(xx), dtype=dtype)
+    vnn = np.empty(len(xx), dtype=dtype)
+    scratch = np.empty(len(xx), dtype=dtype)
+
+    # Grid spacing is time-invariant; hoisted out of the loop
+    dx = xx[1] - xx[0]
 
-    for i in range(0, nt-1): 
+    # a, b and xx are time-invariant, so the CFL time steps are too
+    dt_a = cfl_adv_burger(a, xx) * cfl_cut
+    dt_b = cfl_adv_burger(b, xx) * cfl_cut
+    dt = min(dt_a, dt_b) * 0.5 # XXX ADD 0.5 HERE
 
-        # Calculate timestep
-        dt_a = cfl_adv_burger(a, xx) * cfl_cut
-        dt_b = cfl_adv_burger(b, xx) * cfl_cut
-        dt = np.min([dt_a, dt_b]) * 0.5 # XXX ADD 0.5 HERE
-        dx = xx[1] - xx[0]
+    cc_a = (a*dt) / (4*dx)
+    cc_b = (b*dt) / (2*dx)
 
-        unnt[:, i] = 0.5 * (np.roll(wnnt[:, i], -1) + np.roll(wnnt[:, i], 1)) - ((a*dt) / (4*dx) * (np.roll(wnnt[:, i], -1) - np.roll(wnnt[:, i], 1)))
-        vnnt[:, i] = 0.5 * (np.roll(unnt[:, i], -1) + np.roll(unnt[:, i], 1)) - ((b*dt) / (2*dx) * (np.roll(unnt[:, i], -1) - np.roll(unnt[:, i], 1)))
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
+    for i in range(0, nt-1):
+
+        _fill_halo(wnnt[i], halo)
+        _lax_step(um, up, cc_a, unn, scratch)
+        _fill_halo(unn, halo)
+        _lax_step(um, up, cc_b, vnn, scratch)
 
         # Using the Hyman predictor-corrector scheme
         if i == 0:
-            vnnt[:, i], u_prev, dt_v = hyman(xx, unnt[:, i], dt/2, a=b, cfl_cut=cfl_cut, ddx=ddx,)
-        else: 
-            vnnt[:, i], u_prev, dt_v = hyman(xx, unnt[:, i], dt/2, a=b, cfl_cut=cfl_cut, ddx=ddx, fold=u_prev, dtold=dt_v)
-        
-        wnnt[:, i] = 0.5 * (np.roll(vnnt[:, i], -1) + np.roll(vnnt[:, i], 1)) - ((a*dt) / (4*dx) * (np.roll(vnnt[:, i], -1) - np.roll(vnnt[:, i], 1)))
+            v_h, u_prev, dt_v = hyman(xx, unn, dt/2, a=b, cfl_cut=cfl_cut, ddx=ddx,)
+        else:
+            v_h, u_prev, dt_v = hyman(xx, unn, dt/2, a=b, cfl_cut=cfl_cut, ddx=ddx, fold=u_prev, dtold=dt_v)
+
+        _fill_halo(v_h, halo)
+        # Final half step written straight into the history row
+        _lax_step(um, up, cc_a, wnnt[i], scratch)
 
-        u_next = wnnt[:, i]
+        u_next = wnnt[i]
         
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw/centr scheme
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            _apply_wrap_bc(wnnt[i+1], u_next, bnd_limits[0], bnd_limits[1])
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
-
-        wnnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+            wnnt[i+1] = np.pad(u_next[slc], bnd_limits, bnd_type)
 
         # Update time
         t[i+1] = t[i] + dt
 
-    return t, wnnt
+    return t, wnnt.T
+
+
+
 
+def _second_diff_wrap(hh, out=None):
+    r"""
+    Periodic second difference hh[j+1] - 2*hh[j] + hh[j-1], bit-identical
+    to np.roll(hh, -1) - 2*hh + np.roll(hh, 1) (same evaluation order) but
+    built with slice arithmetic into a (pre)allocated output instead of
+    two full-size rolled copies.
+
+    Parameters
+    ----------
+    hh : `array`
+        Function sampled on the grid.
+    out : `array`
+        Optional preallocated output array.
+
+    Returns
+    -------
+    `array`
+        The periodic second difference of hh.
+    """
 
+    d2 = np.empty(np.shape(hh)) if out is None else out
+    d2[..., :-1] = hh[..., 1:]
+    d2[..., -1] = hh[..., 0]
+    d2 -= 2 * hh
+    d2[..., 1:] += hh[..., :-1]
+    d2[..., 0] += hh[..., -1]
 
+    return d2
 
 def step_diff_burgers(xx, hh, a, ddx=lambda x, y: deriv_cent(x, y), **kwargs):
     r"""
@@ -1133,11 +2457,74 @@ def step_diff_burgers(xx, hh, a, ddx=lambda x, y: deriv_cent(x, y), **kwargs):
 
     dx = xx[1] - xx[0]
 
-    rhs = a * (np.roll(hh, -1) - 2 * hh + np.roll(hh, 1)) / dx**2 
+    rhs = _second_diff_wrap(hh)
+    rhs *= a
+    rhs /= dx**2
     # rhs = 1st and 2nd derivative of hh
 
     return rhs
 
+@_maybe_njit
+def _evolve_nb(xx, hh, a, nt, dt, bnd_lo, bnd_hi):
+    r"""
+    Compiled time-stepping loop of evolve for a constant `a` and wrap
+    boundaries: the second-difference stencil, Euler update and boundary
+    copy run as one fused pass per step instead of separate NumPy calls.
+
+    Parameters
+    ----------
+    xx : `array`
+        Spatial axis.
+    hh : `array`
+        Function that depends on xx.
+    a : `float`
+        Constant which multiplies the right hand side of the Burger's eq.
+    nt : `int`
+        Number of time steps.
+    dt : `float`
+        Time interval (constant for constant `a`).
+    bnd_lo : `int`
+        Number of boundary pixels at the lower end.
+    bnd_hi : `int`
+        Number of boundary pixels at the upper end.
+
+    Returns
+    -------
+    t : `array`
+        time 1D array
+    unnt : `array`
+        Time and spatial evolution of u^n_j (time-major).
+    """
+    N = xx.shape[0]
+    dx2 = (xx[1] - xx[0]) ** 2
+    # dt is constant, so the whole time axis is known up front; no
+    # serial accumulation dependency between steps
+    t = np.arange(nt) * dt
+    unnt = np.zeros((nt, N))
+    u_next = np.empty(N)
+    for j in range(N):
+        unnt[0, j] = hh[j]
+    u = unnt[0]
+
+    for i in range(0, nt - 1):
+
+        for j in range(N):
+            jp = j + 1 if j < N - 1 else 0
+            jm = j - 1 if j > 0 else N - 1
+            rhs = (u[jp] - 2 * u[j] + u[jm]) * a / dx2
+            u_next[j] = u[j] + rhs * dt
+
+        # Fix boundaries, same as np.pad(u_next[lo:N-hi], (lo, hi), "wrap")
+        u = unnt[i + 1]
+        for j in range(bnd_lo, N - bnd_hi):
+            u[j] = u_next[j]
+        for j in range(bnd_lo):
+            u[j] = u_next[N - bnd_hi - bnd_lo + j]
+        for j in range(bnd_hi):
+            u[N - bnd_hi + j] = u_next[bnd_lo + j]
+
+    return t, unnt
+
 def evolve(
     xx: np.ndarray,
     hh: np.ndarray,
@@ -1186,31 +2573,42 @@ def evolve(
         all the elements of the domain.
     """
 
-    t = np.zeros((nt))
-    unnt = np.zeros((len(xx), nt))
-    unnt[:, 0] = hh
+    # Compiled fast path: constant a and wrap boundaries
+    if _HAS_NUMBA and np.ndim(a) == 0 and bnd_type == "wrap":
+        dt = cfl_diff_burger(a, xx) * cfl_cut
+        t, unnt = _evolve_nb(
+            np.asarray(xx, dtype=float), np.asarray(hh, dtype=float),
+            float(a), nt, dt, bnd_limits[0], bnd_limits[1]
+        )
+        return t, unnt.T
+
+    # Time-major layout: unnt[i] is a contiguous row; transposed on return
+    unnt = np.zeros((nt, len(xx)))
+    unnt[0] = hh
+
+    # a and xx are time-invariant, so the CFL time step is too; with dt
+    # constant the full time axis is known before the loop starts
+    dt = cfl_diff_burger(a, xx) * cfl_cut
+    t = np.arange(nt) * dt
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
 
     for i in range(0, nt-1): 
 
-        dx = xx[1] - xx[0]
-        rhs = step_diff_burgers(xx, unnt[:, i], a=a, cfl_cut=cfl_cut)
-        dt = cfl_diff_burger(a, xx) * cfl_cut 
+        rhs = step_diff_burgers(xx, unnt[i], a=a, cfl_cut=cfl_cut)
 
         # Compute next timestep
-        u_next = unnt[:, i] + rhs * dt
+        u_next = unnt[i] + rhs * dt
         
-        # Fix boundaries 
-        if bnd_limits[1] > 0: 
-            u_next_temp = u_next[bnd_limits[0] : -bnd_limits[1]]  # dnw / central scheme
+        # Fix boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            _apply_wrap_bc(unnt[i+1], u_next, bnd_limits[0], bnd_limits[1])
         else:
-            u_next_temp = u_next[bnd_limits[0] :] # upw scheme
-
-        unnt[:, i+1] = np.pad(u_next_temp, bnd_limits, bnd_type) 
+            unnt[i+1] = np.pad(u_next[slc], bnd_limits, bnd_type)
 
-        # Update time
-        t[i+1] = t[i] + dt
-
-    return t, unnt
+    return t, unnt.T
 
 def NR_f(xx, un, uo, a, dt, **kwargs):
     r"""
@@ -1237,7 +2635,11 @@ def NR_f(xx, un, uo, a, dt, **kwargs):
 
     dx = xx[1] - xx[0]
 
-    F_j =  un - uo - a * (np.roll(un, -1) - 2 * un + np.roll(un, 1)) * dt / dx**2
+    d2 = _second_diff_wrap(un)
+    d2 *= a
+    d2 *= dt
+    d2 /= dx**2
+    F_j = un - uo - d2
 
     return F_j
 
@@ -1261,22 +2663,24 @@ def jacobian(xx, un, a, dt, **kwargs):
     Returns
     -------
     `array`
-        Jacobian F_j'(u^{n+1}{k})
+        (3, N) banded Jacobian F_j'(u^{n+1}{k}) in scipy.linalg.solve_banded
+        layout: row 0 holds the upper diagonal, row 1 the main diagonal and
+        row 2 the lower diagonal.
     """
 
     # Calculate jacobian
-    # Matrix that is 0 or 1 depending on when the indx is j or k
+    # The matrix is strictly tridiagonal, so only the three diagonals are
+    # stored instead of a dense N x N matrix
 
+    N = xx.shape[0]
     dx = xx[1] - xx[0]
+    # The off-diagonal coefficient appears in every entry; computed once
+    c = dt * a / dx**2
 
-    J = np.zeros((len(xx), len(xx)))
-
-    for i in range(len(xx)):
-        J[i, i] = 1 + dt * 2 * a / dx**2
-        if i < len(xx) - 1:
-            J[i, i+1] = -dt * a / dx**2
-        if i > 1:
-            J[i, i-1] = -dt * a / dx**2
+    J = np.zeros((3, N))
+    J[0, 1:] = -c
+    J[1, :] = 1 + 2 * c
+    J[2, :-1] = -c
 
     return J
 
@@ -1324,47 +2728,72 @@ def Newton_Raphson(
     countt : `list(int)`
         number iterations for each timestep
     """
-    err = 1.0
-    unnt = np.zeros((np.size(xx), nt))
+    N = xx.shape[0]
+    # Time-major layout: unnt[it] is a contiguous row; transposed on return
+    unnt = np.zeros((nt, N))
     errt = np.zeros((nt))
     countt = np.zeros((nt))
-    unnt[:, 0] = hh
+    unnt[0] = hh
     t = np.zeros((nt))
 
+    # The Jacobian depends only on a, dt and the grid spacing -- not on
+    # the iterate -- so it is built once instead of every Newton iteration.
+    # It is also symmetric (the same -c sits on both off-diagonals) and
+    # strictly diagonally dominant, so the Cholesky-based solver applies;
+    # its upper band form is exactly the first two rows of the banded
+    # layout. jacobian_u stays on solve_banded: its off-diagonals differ.
+    jac = jacobian(xx, hh, a, dt)[:2]  # Jacobian (upper banded)
+
+    # The band cannot hold the two periodic corner entries (-c at (0, N-1)
+    # and (N-1, 0)), which is what made each solve approximate and forced
+    # the iteration. Splitting A = B - c u u^T with u = e_0 + e_{N-1}
+    # moves the corners into a rank-one Sherman-Morrison correction: B is
+    # the band with +c added at both diagonal ends, and the correction
+    # vector z = B^{-1} u is loop-invariant.
+    c = dt * a / (xx[1] - xx[0]) ** 2
+    jac[1, 0] += c
+    jac[1, -1] += c
+    # The band is identical for every timestep, so it is Cholesky-factored
+    # once here and only the O(N) triangular solves run inside the loop
+    jac_cb = cholesky_banded(jac)
+    u_sm = np.zeros(N)
+    u_sm[0] = 1.0
+    u_sm[-1] = 1.0
+    z = cho_solve_banded((jac_cb, False), u_sm)
+    denom = 1 - c * (z[0] + z[-1])
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
     ## Looping over time
     for it in range(1, nt):
-        uo = unnt[:, it - 1]
-        ug = unnt[:, it - 1]
-        count = 0
-        # iteration to reduce the error.
-        while (err >= toll) and (count < ncount):
-
-            jac = jacobian(xx, ug, a, dt)  # Jacobian
-            ff1 = NR_f(xx, ug, uo, a, dt)  # F
-            # Inversion:
-            un = ug - np.matmul(np.linalg.inv(jac), ff1)
-
-            # error:
-            err = np.max(np.abs(un - ug) / (np.abs(un) + toll))  # error
-            # err = np.max(np.abs(un-ug))
-            errt[it] = err
-
-            # Number of iterations
-            count += 1
-            countt[it] = count
-
-            # Boundaries
-            if bnd_limits[1] > 0:
-                u1_c = un[bnd_limits[0] : -bnd_limits[1]]
-            else:
-                u1_c = un[bnd_limits[0] :]
-            un = np.pad(u1_c, bnd_limits, bnd_type)
-            ug = un
-        err = 1.0
+        uo = unnt[it - 1]
+
+        # F is linear in u^{n+1} (a never depends on the iterate), so a
+        # single exact Newton step from ug = uo lands on the solution and
+        # the iteration loop is not needed; Newton_Raphson_u keeps it.
+        ff1 = NR_f(xx, uo, uo, a, dt)  # F
+        # Symmetric tridiagonal solve against the prefactored band
+        y = cho_solve_banded((jac_cb, False), ff1)
+        # Rank-one periodic correction completes the exact solve
+        y += (c * (y[0] + y[-1]) / denom) * z
+        un = uo - y
+
+        # error: size of the single (exact) update
+        errt[it] = np.max(np.abs(un - uo) / (np.abs(un) + toll))  # error
+        # err = np.max(np.abs(un-ug))
+        countt[it] = 1
+
+        # Boundaries: direct edge writes for wrap, np.pad otherwise
+        if bnd_type == "wrap":
+            un = _apply_wrap_bc(un, un, bnd_limits[0], bnd_limits[1])
+        else:
+            un = np.pad(un[slc], bnd_limits, bnd_type)
         t[it] = t[it - 1] + dt
-        unnt[:, it] = un
+        unnt[it] = un
 
-    return t, unnt, errt, countt
+    return t, unnt.T, errt, countt
 
 def NR_f_u(xx, un, uo, dt, **kwargs):
     r"""
@@ -1390,9 +2819,13 @@ def NR_f_u(xx, un, uo, dt, **kwargs):
     """
 
     dx = xx[1] - xx[0]
-    return un - uo - un * (np.roll(un, -1) - 2 * un + np.roll(un, 1)) * dt / dx**2
+    d2 = _second_diff_wrap(un)
+    d2 *= un
+    d2 *= dt
+    d2 /= dx**2
+    return un - uo - d2
 
-def jacobian_u(xx, un, dt, **kwargs):
+def jacobian_u(xx, un, dt, out=None, **kwargs):
     """
     Jacobian of the F function.
 
@@ -1404,23 +2837,30 @@ def jacobian_u(xx, un, dt, **kwargs):
         Function that depends on xx.
     dt : `int`
         Time interval
+    out : `array`
+        Optional preallocated (3, N) array to fill; must come in zeroed
+        (the two unused band corners are never written).
 
     Returns
     -------
     `array`
-        Jacobian F_j'(u^{n+1}{k})
+        (3, N) banded Jacobian F_j'(u^{n+1}{k}) in scipy.linalg.solve_banded
+        layout: row 0 holds the upper diagonal, row 1 the main diagonal and
+        row 2 the lower diagonal.
     """
 
+    N = xx.shape[0]
     dx = xx[1] - xx[0]
 
-    J = np.zeros((len(xx), len(xx)))
+    # The matrix is strictly tridiagonal, so only the three diagonals are
+    # stored instead of a dense N x N matrix; the coefficient array is
+    # shared by all three
+    cu = dt * un / dx**2
 
-    for i in range(len(xx)):
-        J[i, i] = 1 + dt * 2 * un[i] / dx**2
-        if i < len(xx) - 1:
-            J[i, i+1] = -dt * un[i] / dx**2
-        if i > 1:
-            J[i, i-1] = -dt * un[i] / dx**2
+    J = np.zeros((3, N)) if out is None else out
+    J[0, 1:] = -cu[:-1]
+    J[1, :] = 1 + 2 * cu
+    J[2, :-1] = -cu[1:]
 
     return J
 
@@ -1468,24 +2908,34 @@ def Newton_Raphson_u(
     """
     
     err = 1.0
-    unnt = np.zeros((np.size(xx), nt))
+    N = xx.shape[0]
+    # Time-major layout: unnt[it] is a contiguous row; transposed on return
+    unnt = np.zeros((nt, N))
     errt = np.zeros((nt))
     countt = np.zeros((nt))
-    unnt[:, 0] = hh
+    unnt[0] = hh
     t = np.zeros((nt))
 
+    # The (3, N) banded Jacobian buffer is reused across all Newton
+    # iterations; jacobian_u rewrites the three diagonals in place
+    jac = np.zeros((3, N))
+
+    # Pad slice for the non-wrap fallback, decided once outside the loop
+    lo, hi = bnd_limits
+    slc = slice(lo, -hi) if hi > 0 else slice(lo, None)
+
     ## Looping over time
     for it in range(1, nt):
-        uo = unnt[:, it - 1]
-        ug = unnt[:, it - 1]
+        uo = unnt[it - 1]
+        ug = unnt[it - 1]
         count = 0
         # iteration to reduce the error.
         while (err >= toll) and (count < ncount):
 
-            jac = jacobian_u(xx, ug, dt)  # Jacobian
+            jacobian_u(xx, ug, dt, out=jac)  # Jacobian (banded)
             ff1 = NR_f_u(xx, ug, uo, dt)  # F
-            # Inversion:
-            un = ug - np.matmul(np.linalg.inv(jac), ff1)
+            # Tridiagonal solve, O(N) instead of the dense inversion
+            un = ug - solve_banded((1, 1), jac, ff1)
 
             # error
             err = np.max(np.abs(un - ug) / (np.abs(un) + toll))
@@ -1495,18 +2945,17 @@ def Newton_Raphson_u(
             count += 1
             countt[it] = count
 
-            # Boundaries
-            if bnd_limits[1] > 0:
-                u1_c = un[bnd_limits[0] : -bnd_limits[1]]
+            # Boundaries: direct edge writes for wrap, np.pad otherwise
+            if bnd_type == "wrap":
+                un = _apply_wrap_bc(un, un, bnd_limits[0], bnd_limits[1])
             else:
-                u1_c = un[bnd_limits[0] :]
-            un = np.pad(u1_c, bnd_limits, bnd_type)
+                un = np.pad(un[slc], bnd_limits, bnd_type)
             ug = un
         err = 1.0
         t[it] = t[it - 1] + dt
-        unnt[:, it] = un
+        unnt[it] = un
 
-    return t, unnt, errt, countt
+    return t, unnt.T, errt, countt
 
 def taui_sts(nu, niter, iiter):
     """
@@ -1597,7 +3046,7 @@ def hyman(
 
     dt, u1_temp = step_adv_burgers(xx, f, a, ddx=ddx)
 
-    if np.any(fold) == None:
+    if fold is None:
         fold = np.copy(f)
         f = (np.roll(f, 1) + np.roll(f, -1)) / 2.0 + u1_temp * dth
         dtold = dth
@@ -1612,21 +3061,31 @@ def hyman(
 
         f, fold, fsav = hyman_pred(f, fold, u1_temp, a1, b1, a2, b2)
 
-        if bnd_limits[1] > 0:
-            u1_c = f[bnd_limits[0] : -bnd_limits[1]]
+        # The predictor edges feed the derivative below, so this boundary
+        # fix cannot be dropped; for wrap it is two edge writes in place
+        if bnd_type == "wrap":
+            f = _apply_wrap_bc(f, f, bnd_limits[0], bnd_limits[1])
         else:
-            u1_c = f[bnd_limits[0] :]
-        f = np.pad(u1_c, bnd_limits, bnd_type)
+            if bnd_limits[1] > 0:
+                u1_c = f[bnd_limits[0] : -bnd_limits[1]]
+            else:
+                u1_c = f[bnd_limits[0] :]
+            f = np.pad(u1_c, bnd_limits, bnd_type)
 
         dt, u1_temp = step_adv_burgers(xx, f, a, cfl_cut, ddx=ddx)
 
         f = hyman_corr(f, fsav, u1_temp, c2)
 
-    if bnd_limits[1] > 0:
-        u1_c = f[bnd_limits[0] : -bnd_limits[1]]
+    # The corrector rebuilds f from fsav, whose edges were never fixed, so
+    # this second boundary fix is needed as well
+    if bnd_type == "wrap":
+        f = _apply_wrap_bc(f, f, bnd_limits[0], bnd_limits[1])
     else:
-        u1_c = f[bnd_limits[0] :]
-    f = np.pad(u1_c, bnd_limits, bnd_type)
+        if bnd_limits[1] > 0:
+            u1_c = f[bnd_limits[0] : -bnd_limits[1]]
+        else:
+            u1_c = f[bnd_limits[0] :]
+        f = np.pad(u1_c, bnd_limits, bnd_type)
 
     dtold = dth
 
@@ -1636,9 +3095,13 @@ def hyman_corr(f, fsav, dfdt, c2):
     return fsav + c2 * dfdt
 
 def hyman_pred(f, fold, dfdt, a1, b1, a2, b2):
+    # One copy of f is enough: the same array provides the saved values
+    # for the second stage and then rotates out as the new fold. Copying
+    # cannot be dropped entirely -- callers reuse the buffer behind f, so
+    # the returned fold must own its values.
     fsav = np.copy(f)
     tempvar = f + a1 * (fold - f) + b1 * dfdt
-    fold = np.copy(fsav)
+    fold = fsav
     fsav = tempvar + a2 * (fsav - tempvar) + b2 * dfdt
     f = tempvar
 
@@ -27,14 +27,11 @@ def u_analytical(xx: np.ndarray, tt: np.ndarray, a: float = -1) -> np.ndarray:
     x0 = -2.6
     xf = 2.6
 
-    u_an = np.zeros((len(xx), len(tt)))
-    x_new = np.zeros((len(xx), len(tt)))
+    # Broadcast over (nx, nt) in one vectorized pass instead of filling
+    # the columns one timestep at a time
+    x_new = ((xx[:, None] - a * tt[None, :]) - x0) % (xf - x0) + x0
+    u_an = u_initial(x_new)
 
-    for i in range(len(tt)):
-
-        x_new[:, i] = ((xx - a * tt[i] ) - x0) % (xf - x0) + x0
-        u_an[:, i] = u_initial(x_new[:, i], tt[i])
-    
     return u_an
 
 
@@ -54,7 +51,12 @@ def u_initial(x: np.ndarray, t: float = 0) -> np.ndarray:
     `array`
         the initial condition.
     """
-    return np.cos(6*np.pi*x / 5)**2 / np.cosh(5*x**2)
+    # 1/cosh(y) written as 2*exp(-y)/(1 + exp(-2y)): exp(-y) underflows
+    # gracefully where cosh(y) would overflow, and squaring the cosine
+    # directly avoids the pow ufunc
+    c = np.cos(6*np.pi*x / 5)
+    e = np.exp(-5*x**2)
+    return c*c * 2*e / (1 + e*e)
 
 
 